@@ -6,6 +6,7 @@
 """Azure KeyVault pre-authentication."""
 import logging
 import sys
+import time
 from collections import namedtuple
 from datetime import datetime
 from enum import Enum
@@ -47,6 +48,13 @@ _EXCLUDED_AUTH = {
     "cache": True,
 }
 
+# casefolded cloud alias lookup used by AzureCloudConfig.resolve_cloud_alias
+_ALIAS_CF = {alias.casefold(): cloud for alias, cloud in CLOUD_ALIASES.items()}
+_ALIAS_VALUES_CF = set(_ALIAS_CF.values())
+
+# Seconds before token expiry at which _AzCachedConnect re-checks the token
+_TOKEN_REFRESH_WINDOW = 30
+
 
 def get_azure_config_value(key, default):
     """Get a config value from Azure section."""
@@ -96,10 +104,9 @@ class AzureCloudConfig:
     def resolve_cloud_alias(alias) -> Optional[str]:
         """Return match of cloud alias or name."""
         alias_cf = alias.casefold()
-        aliases = {alias.casefold(): cloud for alias, cloud in CLOUD_ALIASES.items()}
-        if alias_cf in aliases:
-            return aliases[alias_cf]
-        if alias_cf in aliases.values():
+        if alias_cf in _ALIAS_CF:
+            return _ALIAS_CF[alias_cf]
+        if alias_cf in _ALIAS_VALUES_CF:
             return alias_cf
         return None
 
@@ -204,23 +211,24 @@ def _az_connect_core(
 
     """
     # Create the auth methods with the specified cloud region
-    cloud = cloud or kwargs.pop("region", AzureCloudConfig().cloud)
-    az_config = AzureCloudConfig(cloud)
+    az_config = AzureCloudConfig(cloud or kwargs.pop("region", None), tenant_id)
     aad_uri = az_config.endpoints.active_directory
-    tenant_id = tenant_id or AzureCloudConfig().tenant_id
+    tenant_id = az_config.tenant_id
     if auth_methods:
-        for method in auth_methods:
-            if method in _EXCLUDED_AUTH:
-                _EXCLUDED_AUTH[method] = False
+        # copy the default exclusions - don't modify the module-level dict
+        excluded = {
+            method: exclude and method not in auth_methods
+            for method, exclude in _EXCLUDED_AUTH.items()
+        }
         creds = DefaultAzureCredential(
             authority=aad_uri,
-            exclude_cli_credential=_EXCLUDED_AUTH["cli"],
-            exclude_environment_credential=_EXCLUDED_AUTH["env"],
-            exclude_managed_identity_credential=_EXCLUDED_AUTH["msi"],
-            exclude_powershell_credential=_EXCLUDED_AUTH["powershell"],
-            exclude_visual_studio_code_credential=_EXCLUDED_AUTH["vscode"],
-            exclude_shared_token_cache_credential=_EXCLUDED_AUTH["cache"],
-            exclude_interactive_browser_credential=_EXCLUDED_AUTH["interactive"],
+            exclude_cli_credential=excluded["cli"],
+            exclude_environment_credential=excluded["env"],
+            exclude_managed_identity_credential=excluded["msi"],
+            exclude_powershell_credential=excluded["powershell"],
+            exclude_visual_studio_code_credential=excluded["vscode"],
+            exclude_shared_token_cache_credential=excluded["cache"],
+            exclude_interactive_browser_credential=excluded["interactive"],
             interactive_browser_tenant_id=tenant_id,
         )
     else:
@@ -239,9 +247,7 @@ def _az_connect_core(
     logging.basicConfig(level=logging.WARNING, handlers=[handler])
 
     # Connect to the subscription client to validate
-    legacy_creds = CredentialWrapper(
-        creds, resource_id=AzureCloudConfig(cloud).token_uri
-    )
+    legacy_creds = CredentialWrapper(creds, resource_id=az_config.token_uri)
     if not creds:
         raise CloudError("Could not obtain credentials.")
 
@@ -264,6 +270,8 @@ class _AzCachedConnect:
         """Initialize the class."""
         self.az_credentials: Optional[AzCredentials] = None
         self.cred_cloud: str = self.current_cloud
+        # expiry (POSIX timestamp) of the last token retrieved
+        self._expires_on: float = 0
 
     @property
     def current_cloud(self) -> str:
@@ -273,25 +281,29 @@ class _AzCachedConnect:
     def connect(self, *args, **kwargs):
         """Call az_connect_core if token is not present or expired."""
         if self.az_credentials is None:
-            self.az_credentials = _az_connect_core(*args, **kwargs)
+            self._reconnect(*args, **kwargs)
             return self.az_credentials
-        # Check expiry
-        if (
-            datetime.utcfromtimestamp(
-                self.az_credentials.modern.get_token(
-                    AzureCloudConfig().token_uri
-                ).expires_on
-            )
-            <= datetime.utcnow()
-        ):
-            self.az_credentials = _az_connect_core(*args, **kwargs)
+        az_config = AzureCloudConfig()
+        # Check expiry - only query the credential (which may need to
+        # call out to Azure CLI, etc.) if the cached expiry is close.
+        if self._expires_on - time.time() <= _TOKEN_REFRESH_WINDOW:
+            self._expires_on = self.az_credentials.modern.get_token(
+                az_config.token_uri
+            ).expires_on
+            if self._expires_on <= time.time():
+                self._reconnect(*args, **kwargs)
         # Check changed cloud
         if self.cred_cloud != kwargs.get(
-            "cloud", kwargs.get("region", self.current_cloud)
+            "cloud", kwargs.get("region", az_config.cloud)
         ):
-            self.az_credentials = _az_connect_core(*args, **kwargs)
+            self._reconnect(*args, **kwargs)
         return self.az_credentials
 
+    def _reconnect(self, *args, **kwargs):
+        """Create new credentials and reset the cached expiry."""
+        self.az_credentials = _az_connect_core(*args, **kwargs)
+        self._expires_on = 0
+
 
 # externally callable function using the class above
 # _AZ_CACHED_CONNECT = _AzCachedConnect()
@@ -305,21 +317,33 @@ def only_interactive_cred(chained_cred: ChainedTokenCredential):
     )
 
 
+# Replacement messages for credential warnings, keyed by credential name
+_CRED_WARNINGS = (
+    (
+        "EnvironmentCredential",
+        "Unable to sign-in with environment variable credentials.",
+    ),
+    ("AzureCliCredential", "Unable to sign-in with Azure CLI credentials."),
+    (
+        "ManagedIdentityCredential",
+        "Unable to sign-in with Managed Instance credentials.",
+    ),
+)
+
+
 def _filter_credential_warning(record) -> bool:
     """Rewrite out credential not found message."""
-    if (
-        not record.name.startswith("azure.identity")
-        or record.levelno != logging.WARNING
+    # check level/logger before the (more expensive) message formatting
+    if record.levelno != logging.WARNING or not record.name.startswith(
+        "azure.identity"
     ):
         return True
     message = record.getMessage()
     if ".get_token" in message:
-        if message.startswith("EnvironmentCredential"):
-            print("Unable to sign-in with environment variable credentials.")
-        if message.startswith("AzureCliCredential"):
-            print("Unable to sign-in with Azure CLI credentials.")
-        if message.startswith("ManagedIdentityCredential"):
-            print("Unable to sign-in with Managed Instance credentials.")
+        for cred_name, warning in _CRED_WARNINGS:
+            if message.startswith(cred_name):
+                print(warning)
+                break
     return not message
 
 
@@ -354,10 +378,7 @@ def check_cli_credentials() -> Tuple[AzureCliStatus, Optional[str]]:
             and len(raw_token[0]) == 3
         ):
             bearer_token = raw_token[0][2]
-            if (
-                parser.parse(bearer_token.get("expiresOn", datetime.min))
-                < datetime.now()
-            ):
+            if _parse_token_expiry(bearer_token.get("expiresOn")) < datetime.now():
                 raise ValueError("AADSTS70043: The refresh token has expired")
 
         return AzureCliStatus.CLI_OK, "Azure CLI credentials available."
@@ -378,3 +399,14 @@ def check_cli_credentials() -> Tuple[AzureCliStatus, Optional[str]]:
             )
             return AzureCliStatus.CLI_NEEDS_SIGN_IN, message
         return AzureCliStatus.CLI_UNKNOWN_ERROR, None
+
+
+def _parse_token_expiry(expires_on: Optional[str]) -> datetime:
+    """Return datetime of Azure CLI token `expiresOn` value."""
+    if not expires_on:
+        return datetime.min
+    try:
+        # Azure CLI uses ISO format - avoid the slower generic dateutil parser
+        return datetime.fromisoformat(expires_on)
+    except ValueError:
+        return parser.parse(expires_on)
@@ -27,6 +27,12 @@ import pkg_resources
 import yaml
 from yaml.error import YAMLError
 
+try:
+    # use the libyaml C loader if available - much faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 from .._version import VERSION
 from . import exceptions
 from .exceptions import MsticpyUserConfigError
@@ -180,9 +186,9 @@ def _read_config_file(config_file: str) -> Dict[str, Any]:
     """
     if Path(config_file).is_file():
         with open(config_file, "r", encoding="utf-8") as f_handle:
-            # use safe_load instead of load
+            # use safe loader instead of default yaml.load
             try:
-                return yaml.safe_load(f_handle)
+                return yaml.load(f_handle, Loader=_YamlLoader)  # nosec
             except YAMLError as yml_err:
                 raise MsticpyUserConfigError(
                     f"Check that your {config_file} is valid YAML.",
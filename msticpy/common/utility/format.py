@@ -6,7 +6,6 @@
 """Formatting and checking functions."""
 import builtins
 import re
-import uuid
 from typing import Any
 
 from ..._version import VERSION
@@ -15,6 +14,10 @@ from .types import export
 __version__ = VERSION
 __author__ = "Ian Hellen"
 
+_BUILTINS = frozenset(dir(builtins))
+_PYNAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+_UUID_RE = re.compile(r"\{?[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}\}?")
+
 
 @export
 def is_valid_uuid(uuid_str: str) -> bool:
@@ -32,13 +35,9 @@ def is_valid_uuid(uuid_str: str) -> bool:
         True if valid GUID/UUID.
 
     """
-    if not uuid_str:
-        return False
-    try:
-        uuid.UUID(uuid_str)
-    except (ValueError, TypeError):
+    if not uuid_str or not isinstance(uuid_str, str):
         return False
-    return True
+    return _UUID_RE.fullmatch(uuid_str) is not None
 
 
 @export
@@ -57,11 +56,10 @@ def valid_pyname(identifier: str) -> str:
         The cleaned identifier
 
     """
-    builtin_names = set(dir(builtins))
-    if identifier in builtin_names:
+    if identifier in _BUILTINS:
         identifier = f"{identifier}_bi"
-    identifier = re.sub("[^a-zA-Z0-9_]", "_", identifier)
-    if identifier[0].isdigit():
+    identifier = _PYNAME_RE.sub("_", identifier)
+    if identifier[:1].isdigit():
         identifier = f"n_{identifier}"
     return identifier
 
@@ -69,25 +67,25 @@ def valid_pyname(identifier: str) -> str:
 @export
 def string_empty(string: str) -> bool:
     """Return True if the input string is None or whitespace."""
-    return not (bool(string) or isinstance(string, str) and bool(string.strip()))
+    return not string or (isinstance(string, str) and string.isspace())
 
 
 @export
 def is_not_empty(test_object: Any) -> bool:
     """Return True if the test_object is not None or empty."""
-    if test_object:
-        return bool(test_object.strip()) if isinstance(test_object, str) else True
-    return False
+    return bool(test_object) and (
+        not isinstance(test_object, str) or not test_object.isspace()
+    )
 
 
 # String escapes
 @export
 def escape_windows_path(str_path: str) -> str:
     """Escape backslash characters in a string."""
-    return str_path.replace("\\", "\\\\") if is_not_empty(str_path) else str_path
+    return str_path.replace("\\", "\\\\") if str_path else str_path
 
 
 @export
 def unescape_windows_path(str_path: str) -> str:
     """Remove escaping from backslash characters in a string."""
-    return str_path.replace("\\\\", "\\") if is_not_empty(str_path) else str_path
+    return str_path.replace("\\\\", "\\") if str_path else str_path
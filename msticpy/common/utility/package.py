@@ -185,7 +185,8 @@ _MSTICPY_USER_AGENT = _get_mp_ua()
 @export
 def mp_ua_header() -> Dict[str, str]:
     """Return headers dict for MSTICPy User Agent."""
-    return {"UserAgent": _get_mp_ua()}
+    # return a new dict each time since callers may add to it
+    return {"UserAgent": _MSTICPY_USER_AGENT}
 
 
 @export
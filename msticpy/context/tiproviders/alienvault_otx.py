@@ -12,7 +12,7 @@ processing performance may be limited to a specific number of
 requests per minute for the account type that you have.
 
 """
-from typing import Any, Tuple
+from typing import Any, Dict, Tuple
 
 import attr
 
@@ -26,12 +26,10 @@ __author__ = "Ian Hellen"
 
 
 # pylint: disable=too-few-public-methods
-@attr.s
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class _OTXParams(IoCLookupParams):
     # override IoCLookupParams to set common defaults
-    def __attrs_post_init__(self):
-        # pylint: disable=
-        self.headers = {"X-OTX-API-KEY": "{API_KEY}"}
+    headers: Dict[str, str] = attr.Factory(lambda: {"X-OTX-API-KEY": "{API_KEY}"})
 
 
 @export
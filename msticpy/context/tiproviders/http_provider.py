@@ -13,14 +13,16 @@ requests per minute for the account type that you have.
 
 """
 import abc
-import traceback
-from functools import lru_cache
+import asyncio
+from functools import lru_cache, partial
 from http import client
+from importlib.util import find_spec
 from json import JSONDecodeError
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import attr
 import httpx
+import pandas as pd
 from attr import Factory
 
 from ..._version import VERSION
@@ -29,14 +31,20 @@ from ...common.pkg_config import get_http_timeout
 from ...common.utility import export, mp_ua_header
 from .lookup_result import LookupResult, LookupStatus
 from .result_severity import ResultSeverity
-from .ti_provider_base import TIProvider
+from .ti_provider_base import TIProvider, generate_items
 
 __version__ = VERSION
 __author__ = "Ian Hellen"
 
+# HTTP/2 is only used if the optional h2 package is installed
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30
+)
+
 
 # pylint: disable=too-few-public-methods
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class IoCLookupParams:
     """IoC HTTP Lookup Params definition."""
 
@@ -61,11 +69,19 @@ class HttpTIProvider(TIProvider, abc.ABC):
 
     _REQUIRED_PARAMS: List[str] = []
 
+    # Maximum number of simultaneous requests made by lookup_iocs_async
+    _MAX_CONCURRENCY = 4
+
     def __init__(self, **kwargs):
         """Initialize a new instance of the class."""
         super().__init__(**kwargs)
 
-        self._httpx_client = httpx.Client(timeout=get_http_timeout(**kwargs))
+        self._httpx_client = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            timeout=get_http_timeout(**kwargs),
+            limits=_HTTP_LIMITS,
+            headers=mp_ua_header(),
+        )
         self._request_params = {}
         if "ApiID" in kwargs:
             api_id = kwargs.pop("ApiID")
@@ -85,9 +101,10 @@ class HttpTIProvider(TIProvider, abc.ABC):
                 f"Parameter values missing for Provider '{self.__class__.__name__}'",
                 f"Missing parameters are: {param_list}",
             )
+        # per-instance cache of lookup results
+        self._lookup_cache = lru_cache(maxsize=256)(self._lookup_ioc)
 
-    @lru_cache(maxsize=256)
-    def lookup_ioc(  # type: ignore
+    def lookup_ioc(
         self, ioc: str, ioc_type: str = None, query_type: str = None, **kwargs
     ) -> LookupResult:
         """
@@ -123,9 +140,95 @@ class HttpTIProvider(TIProvider, abc.ABC):
         -----
         Note: this method uses memoization (lru_cache) to cache results
         for a particular observable to try avoid repeated network calls for
-        the same item.
+        the same item. The cache is specific to the provider instance and
+        can be emptied with `clear_cache`.
+
+        """
+        return self._lookup_cache(ioc, ioc_type, query_type, **kwargs)
+
+    def clear_cache(self):
+        """Clear the cache of lookup results for this provider."""
+        self._lookup_cache.cache_clear()
+
+    async def lookup_iocs_async(
+        self,
+        data: Union[pd.DataFrame, Dict[str, str], Iterable[str]],
+        obs_col: str = None,
+        ioc_type_col: str = None,
+        query_type: str = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Lookup collection of IoC observables, running requests concurrently.
+
+        Parameters
+        ----------
+        data : Union[pd.DataFrame, Dict[str, str], Iterable[str]]
+            Data input in one of three formats:
+            1. Pandas dataframe (you must supply the column name in
+            `obs_col` parameter)
+            2. Dict of observable, IoCType
+            3. Iterable of observables - IoCTypes will be inferred
+        obs_col : str, optional
+            DataFrame column to use for observables, by default None
+        ioc_type_col : str, optional
+            DataFrame column to use for IoCTypes, by default None
+        query_type : str, optional
+            Specify the data subtype to be queried, by default None.
+            If not specified the default record type for the IoC type
+            will be returned.
+
+        Other Parameters
+        ----------------
+        max_concurrency : int, optional
+            The maximum number of simultaneous requests to the
+            provider, by default 4.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame of results.
 
         """
+        prog_counter = kwargs.pop("prog_counter", None)
+        ioc_type_override = kwargs.pop("ioc_type", None)
+        semaphore = asyncio.Semaphore(
+            kwargs.pop("max_concurrency", self._MAX_CONCURRENCY)
+        )
+
+        async def _lookup_item(
+            observable: str, ioc_type: Optional[str]
+        ) -> LookupResult:
+            async with semaphore:
+                get_ioc = partial(
+                    self.lookup_ioc,
+                    ioc=observable,
+                    ioc_type=ioc_type_override or ioc_type,
+                    query_type=query_type,
+                    **kwargs,
+                )
+                item_result = await asyncio.get_running_loop().run_in_executor(
+                    None, get_ioc
+                )
+            if prog_counter:
+                await prog_counter.decrement()
+            return item_result
+
+        results = await asyncio.gather(
+            *(
+                _lookup_item(observable, ioc_type)
+                for observable, ioc_type in generate_items(data, obs_col, ioc_type_col)
+                if observable
+            )
+        )
+        return pd.DataFrame(
+            data=[pd.Series(attr.asdict(item_result)) for item_result in results]
+        ).rename(columns=LookupResult.column_map())
+
+    def _lookup_ioc(
+        self, ioc: str, ioc_type: str = None, query_type: str = None, **kwargs
+    ) -> LookupResult:
+        """Lookup a single item (uncached version of `lookup_ioc`)."""
         result = self._check_ioc_type(
             ioc=ioc, ioc_type=ioc_type, query_subtype=query_type
         )
@@ -140,9 +243,13 @@ class HttpTIProvider(TIProvider, abc.ABC):
                 result.safe_ioc, result.ioc_type, query_type
             )
             if verb == "GET":
-                response = self._httpx_client.get(
-                    **req_params, timeout=get_http_timeout(**kwargs)
+                # the client default timeout is used unless overridden
+                timeout_args = (
+                    {"timeout": get_http_timeout(**kwargs)}
+                    if "timeout" in kwargs or "def_timeout" in kwargs
+                    else {}
                 )
+                response = self._httpx_client.get(**req_params, **timeout_args)
             else:
                 raise NotImplementedError(f"Unsupported verb {verb}")
             result.status = response.status_code
@@ -213,28 +320,26 @@ class HttpTIProvider(TIProvider, abc.ABC):
             "headers": {},
             "url": src.path.format(observable=value)
             if src.full_url
-            else self._BASE_URL + src.path.format(**req_params),
+            else self._BASE_URL + src.path.format_map(req_params),
         }
 
         if src.headers:
             headers: Dict[str, Any] = {
-                key: val.format(**req_params) for key, val in src.headers.items()
+                key: val.format_map(req_params) for key, val in src.headers.items()
             }
             req_dict["headers"] = headers
-        if "User-Agent" not in req_dict["headers"]:
-            req_dict["headers"].update(mp_ua_header())
         if src.params:
             q_params: Dict[str, Any] = {
-                key: val.format(**req_params) for key, val in src.params.items()
+                key: val.format_map(req_params) for key, val in src.params.items()
             }
             req_dict["params"] = q_params
         if src.data:
             q_data: Dict[str, Any] = {
-                key: val.format(**req_params) for key, val in src.data.items()
+                key: val.format_map(req_params) for key, val in src.data.items()
             }
             req_dict["data"] = q_data
         if src.auth_type and src.auth_str:
-            auth_strs: Tuple = tuple(p.format(**req_params) for p in src.auth_str)
+            auth_strs: Tuple = tuple(p.format_map(req_params) for p in src.auth_str)
             if src.auth_type == "HTTPBasic":
                 req_dict["auth"] = auth_strs
             else:
@@ -285,9 +390,8 @@ class HttpTIProvider(TIProvider, abc.ABC):
     @staticmethod
     def _err_to_results(result: LookupResult, err: Exception):
         result.details = err.args
-        result.raw_result = (
-            type(err).__name__ + "\n" + str(err) + "\n" + traceback.format_exc()
-        )
+        result.raw_result = f"{type(err).__name__}: {err}"
+        result.set_exception(err)
 
     @staticmethod
     def _response_message(status_code):
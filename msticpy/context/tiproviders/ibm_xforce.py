@@ -12,7 +12,7 @@ processing performance may be limited to a specific number of
 requests per minute for the account type that you have.
 
 """
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
 import attr
 
@@ -26,12 +26,11 @@ __author__ = "Ian Hellen"
 
 
 # pylint: disable=too-few-public-methods
-@attr.s
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class _XForceParams(IoCLookupParams):
     # override IoCLookupParams to set common defaults
-    def __attrs_post_init__(self):
-        self.auth_str = ["{API_ID}", "{API_KEY}"]
-        self.auth_type = "HTTPBasic"
+    auth_str: List[str] = attr.Factory(lambda: ["{API_ID}", "{API_KEY}"])
+    auth_type: str = "HTTPBasic"
 
 
 @export
@@ -7,6 +7,7 @@
 import pprint
 from collections import namedtuple
 from enum import Enum
+from traceback import TracebackException
 from typing import Any, Optional, Union
 
 import attr
@@ -33,6 +34,8 @@ class LookupStatus(Enum):
 
 
 # pylint: enable=comparison-with-callable
+# _tb_exception is the only attribute that is not a result field
+# pylint: disable=too-many-instance-attributes
 @attr.s(auto_attribs=True)
 class LookupResult:
     """Lookup result for IoCs."""
@@ -48,6 +51,9 @@ class LookupResult:
     raw_result: Optional[Union[str, dict]] = None
     reference: Optional[str] = None
     status: int = LookupStatus.OK.value
+    # type comment rather than annotation so that attrs does not
+    # treat this as a field (and include it in attr.asdict output)
+    _tb_exception = None  # type: Optional[TracebackException]
 
     @severity.validator
     def _check_severity(self, attribute, value):
@@ -73,6 +79,27 @@ class LookupResult:
         p_pr = pprint.PrettyPrinter(indent=4)
         p_pr.pprint(self.raw_result)
 
+    @property
+    def traceback(self) -> Optional[str]:
+        """Return formatted traceback of any exception raised by the lookup."""
+        if self._tb_exception is None:
+            return None
+        return "".join(self._tb_exception.format())
+
+    def set_exception(self, err: BaseException):
+        """
+        Record an exception raised during the lookup.
+
+        Parameters
+        ----------
+        err : BaseException
+            The exception. The traceback is captured without
+            reading source lines - these are only read if the
+            `traceback` property is accessed.
+
+        """
+        self._tb_exception = TracebackException.from_exception(err, lookup_lines=False)
+
     @property
     def value(self) -> str:
         """Return lookup value."""
@@ -49,6 +49,7 @@ EXTRAS = {
     "ml": ["scikit-learn>=0.20.2", "scipy>=1.1.0", "statsmodels>=0.11.1"],
     "sql2kql": ["moz_sql_parser>=4.5.0,<=4.11.21016"],
     "riskiq": ["passivetotal>=2.5.3"],
+    "http2": ["h2>=3.0.0"],
 }
 extras_all = [
     extra for name, extras in EXTRAS.items() for extra in extras if name != "dev"
@@ -4,25 +4,33 @@
 # license information.
 # --------------------------------------------------------------------------
 """Module docstring."""
+import logging
+import time
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import pytest_check as check
 from msrestazure import azure_cloud
 
 from msticpy.auth.azure_auth_core import (
+    AzCredentials,
     AzureCliStatus,
     AzureCloudConfig,
+    _az_connect_core,
+    _AzCachedConnect,
+    _filter_credential_warning,
     check_cli_credentials,
     default_auth_methods,
+    get_azure_config_value,
 )
+from msticpy.common import pkg_config
 
 from ..unit_test_lib import custom_mp_config, get_test_data_path
 
 __author__ = "Ian Hellen"
 
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name, protected-access
 
 
 @pytest.fixture(scope="module")
@@ -53,6 +61,19 @@ def test_azure_cloud_config(mp_config_file):
     check.equal(f"{glob_rm_uri}.default", az_config.token_uri)
 
 
+def test_azure_config_value_refresh(mp_config_file):
+    """Test Azure config values reflect changes to settings."""
+    with custom_mp_config(mp_config_file):
+        check.equal(get_azure_config_value("cloud", "test"), "global")
+        check.equal(get_azure_config_value("not_a_key", "test"), "test")
+        pkg_config.set_config("Azure", {"cloud": "usgov"})
+        check.equal(pkg_config.get_config("Azure.cloud"), "usgov")
+        check.equal(get_azure_config_value("cloud", "test"), "usgov")
+        check.equal(AzureCloudConfig().cloud, "usgov")
+        pkg_config.refresh_config()
+        check.equal(get_azure_config_value("cloud", "test"), "global")
+
+
 _TOKEN_WRAPPER = ["Bearer", "__b64_str__"]
 
 _TOKEN = {
@@ -70,6 +91,11 @@ _CLI_TESTS = [
         ({"expiresOn": str(datetime.now() - timedelta(0.1))}, None),
         AzureCliStatus.CLI_TOKEN_EXPIRED,
     ),
+    (
+        ({"expiresOn": (datetime.now() + timedelta(0.1)).strftime("%c")}, None),
+        AzureCliStatus.CLI_OK,
+    ),
+    (({"expiresOn": None}, None), AzureCliStatus.CLI_TOKEN_EXPIRED),
     (({}, ImportError), AzureCliStatus.CLI_NOT_INSTALLED),
     (
         ({}, ValueError("AADSTS70043: The refresh token has expired")),
@@ -16,10 +16,21 @@ def test_misc_funcs():
     """Test misc utility functions."""
     check.is_true(utils.string_empty(None))
     check.is_true(utils.string_empty(""))
+    check.is_true(utils.string_empty(" \t\n"))
+    check.is_false(utils.string_empty(" x "))
 
     check.is_false(utils.is_not_empty(None))
     check.is_false(utils.is_not_empty(""))
     check.is_false(utils.is_not_empty({}))
+    check.is_false(utils.is_not_empty("  "))
+    check.is_true(utils.is_not_empty(" x "))
+    check.is_true(utils.is_not_empty([0]))
+
+    check.is_true(utils.is_valid_uuid("6a9e6b8d-4dbb-4c4b-9a8c-34a1f0d2e5c7"))
+    check.is_true(utils.is_valid_uuid("{6A9E6B8D4DBB4C4B9A8C34A1F0D2E5C7}"))
+    check.is_false(utils.is_valid_uuid("6a9e6b8d-4dbb-4c4b-9a8c-34a1f0d2e5"))
+    check.is_false(utils.is_valid_uuid("not-a-uuid"))
+    check.is_false(utils.is_valid_uuid(None))
 
     check.equal(utils.escape_windows_path("C:\\windows"), "C:\\\\windows")
     check.equal(utils.escape_windows_path("C:/windows"), "C:/windows")
@@ -93,6 +104,7 @@ def test_format_py_identifier():
     check.equal(utils.valid_pyname("has space"), "has_space")
     check.equal(utils.valid_pyname("has-dash"), "has_dash")
     check.equal(utils.valid_pyname("10.starts,digit$"), "n_10_starts_digit_")
+    check.equal(utils.valid_pyname(""), "")
 
 
 _D1 = {
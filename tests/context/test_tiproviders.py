@@ -4,15 +4,19 @@
 # license information.
 # --------------------------------------------------------------------------
 """TIProviders test class."""
+import asyncio
 import datetime as dt
 import io
 import json
 import random
 import string
+import threading
+import time
 import warnings
 from contextlib import redirect_stdout
 from pathlib import Path
 
+import httpx
 import pandas as pd
 import pytest
 import pytest_check as check
@@ -20,6 +24,7 @@ import pytest_check as check
 from msticpy.common import pkg_config
 from msticpy.common.provider_settings import get_provider_settings
 from msticpy.context.tilookup import TILookup
+from msticpy.context.tiproviders.ibm_xforce import XForce
 from msticpy.context.tiproviders.preprocess_observable import (
     _clean_url,
     preprocess_observable,
@@ -431,6 +436,107 @@ def test_check_ioc_type(ti_lookup):
     check.equal(lu_result.status, 2)
 
 
+def test_http_provider_cache(ti_lookup):
+    """Test HTTP provider lookup cache is per-instance."""
+    ti_provider = ti_lookup.loaded_providers["GreyNoise"]
+    other_provider = ti_lookup.loaded_providers["OTX"]
+    saved_session = ti_provider._httpx_client
+    ti_provider._httpx_client = RequestSession()
+    ti_provider.clear_cache()
+
+    result = ti_provider.lookup_ioc(ioc=_IOC_IPS[0])
+    check.is_(ti_provider.lookup_ioc(ioc=_IOC_IPS[0]), result)
+    check.equal(ti_provider._lookup_cache.cache_info().hits, 1)
+    check.equal(other_provider._lookup_cache.cache_info().hits, 0)
+
+    ti_provider.clear_cache()
+    check.equal(ti_provider._lookup_cache.cache_info().currsize, 0)
+    ti_provider._httpx_client = saved_session
+
+
+def test_http_provider_substitute_parms():
+    """Test HTTP provider request parameter substitution."""
+    ti_provider = XForce(ApiID="test_id", AuthKey="test_key")
+    verb, req_params = ti_provider._substitute_parms("1.2.3.4", "ipv4", "rep")
+    check.equal(verb, "GET")
+    check.equal(
+        req_params["url"], "https://api.xforce.ibmcloud.com/ipr/history/1.2.3.4"
+    )
+    check.equal(req_params["auth"], ("test_id", "test_key"))
+    with pytest.raises(LookupError):
+        ti_provider._substitute_parms("1.2.3.4", "ipv4", "not_a_query")
+
+
+class _FailingSession:
+    """Mock httpx session that raises an error."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.kwargs = {}
+
+    def get(self, *args, **kwargs):
+        """Raise connection error."""
+        self.kwargs = kwargs
+        raise ConnectionError("Connection refused")
+
+
+def test_http_provider_lookup_error():
+    """Test HTTP provider errors are recorded in the result."""
+    ti_provider = XForce(ApiID="test_id", AuthKey="test_key")
+    ti_provider._httpx_client = _FailingSession()
+    result = ti_provider.lookup_ioc(ioc="1.2.3.4", ioc_type="ipv4")
+    check.equal(result.raw_result, "ConnectionError: Connection refused")
+    check.equal(result.details, ("Connection refused",))
+    check.is_true(result.reference.endswith("/ipr/1.2.3.4"))
+    check.is_in("Traceback", result.traceback)
+    check.is_in("raise ConnectionError", result.traceback)
+    # client default timeout is used unless explicitly overridden
+    check.is_not_in("timeout", ti_provider._httpx_client.kwargs)
+    ti_provider.lookup_ioc(ioc="1.2.3.5", ioc_type="ipv4", timeout=5)
+    check.equal(ti_provider._httpx_client.kwargs["timeout"], httpx.Timeout(5))
+    ti_provider.lookup_ioc(ioc="1.2.3.6", ioc_type="ipv4", def_timeout=10)
+    check.equal(ti_provider._httpx_client.kwargs["timeout"], httpx.Timeout(10))
+
+
+class SlowRequestSession(RequestSession):
+    """Mock httpx session tracking concurrent requests."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get(self, *args, **kwargs):
+        """Return results of httpx.get after a delay."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return super().get(*args, **kwargs)
+
+
+def test_http_provider_concurrent_lookups(ti_lookup):
+    """Test HTTP provider async lookups run concurrently."""
+    ti_provider = ti_lookup.loaded_providers["GreyNoise"]
+    saved_session = ti_provider._httpx_client
+    mock_session = SlowRequestSession()
+    ti_provider._httpx_client = mock_session
+    ti_provider.clear_cache()
+
+    results_df = asyncio.run(
+        ti_provider.lookup_iocs_async(data=(_IOC_IPS + _BENIGN_IPS), max_concurrency=3)
+    )
+    check.equal(20, len(results_df))
+    check.equal(17, len(results_df[results_df["Result"]]))
+    check.equal(list(results_df["Ioc"]), _IOC_IPS + _BENIGN_IPS)
+    check.greater(mock_session.max_active, 1)
+    check.less_equal(mock_session.max_active, 3)
+    ti_provider._httpx_client = saved_session
+
+
 def test_result_severity():
     """Test result severities."""
     sev_inf = ResultSeverity.parse("information")